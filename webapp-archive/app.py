@@ -64,11 +64,35 @@ if 'authenticated' not in st.session_state:
 if 'free_uses' not in st.session_state:
     st.session_state.free_uses = 3  # Give 3 free uses
 
+@st.cache_resource(show_spinner=False)
+def _prewarm():
+    """Import every page module once per server process.
+
+    The router below lazy-imports pages, so without this the first
+    navigation to each page pays its cold import inside a user-visible
+    rerun. Warming them here moves that cost to process startup; the
+    cache_resource guard makes every later call a no-op.
+    """
+    from pages import (  # noqa: F401
+        auth,
+        camera_minimal_clean,
+        home_modern,
+        landing_simple,
+        profile_modern,
+        recipes_modern,
+        results_professional,
+    )
+    from utils import logo  # noqa: F401
+    from components import topbar  # noqa: F401
+    return True
+
 def main():
     # Check current page
     if 'current_page' not in st.session_state:
         st.session_state.current_page = 'landing'
-    
+
+    _prewarm()
+
     # Route to appropriate page
     if st.session_state.current_page == 'landing':
         from pages.landing_simple import show_landing
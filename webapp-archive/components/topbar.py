@@ -3,8 +3,17 @@ Shared top bar component for all pages
 """
 import streamlit as st
 
+def _go_landing():
+    st.session_state.current_page = 'landing'
+
 def render_topbar():
-    """Render the sticky top bar with SnapChef logo"""
+    """Render the sticky top bar with SnapChef logo.
+
+    The logo is a real st.button restyled over the fixed bar: clicking it
+    navigates through the router in a normal rerun instead of the old
+    script-injected hard reload, which re-downloaded the frontend bundle
+    and tore down the websocket.
+    """
     st.markdown("""
         <style>
         /* Sticky top bar */
@@ -33,42 +42,35 @@ def render_topbar():
             }
         }
         
-        /* Logo container */
-        .logo-container {
-            display: flex;
-            align-items: center;
-            gap: 0.75rem;
-            cursor: pointer;
-            text-decoration: none;
-            transition: opacity 0.2s;
+        /* Logo button - pinned over the fixed bar, stripped of the default
+           button chrome so it reads as the wordmark. Scoped by Streamlit's
+           key class: an ancestor :has(.marker) selector would also match the
+           page root container and restyle every button on the page. st-key-*
+           container classes exist from Streamlit 1.39, the floor pinned in
+           requirements.txt - below that this rule silently no-ops and the
+           logo degrades to a plain button */
+        .st-key-logo_home button {
+            position: fixed !important;
+            top: 10px !important;
+            left: 2rem !important;
+            z-index: 100000 !important;
+            background: transparent !important;
+            border: none !important;
+            box-shadow: none !important;
+            padding: 0 !important;
+            font-size: 1.5rem !important;
+            font-weight: 800 !important;
+            color: #000 !important;
+            font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif !important;
+            letter-spacing: -0.02em !important;
+            transition: opacity 0.2s !important;
         }
-        
-        .logo-container:hover {
+
+        .st-key-logo_home button:hover {
             opacity: 0.8;
+            transform: none !important;
         }
-        
-        /* Logo icon */
-        .logo-icon {
-            width: 36px;
-            height: 36px;
-            background: #000;
-            border-radius: 10px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 24px;
-        }
-        
-        /* Logo text */
-        .logo-text {
-            font-size: 1.5rem;
-            font-weight: 800;
-            color: #000;
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-            letter-spacing: -0.02em;
-            margin: 0;
-        }
-        
+
         /* Add padding to main content to account for fixed header */
         .main .block-container {
             padding-top: 70px !important;
@@ -86,30 +88,11 @@ def render_topbar():
         }
         </style>
         
-        <div class="top-bar">
-            <div class="logo-container" id="logo-nav">
-                <div class="logo-icon">👨‍🍳</div>
-                <div class="logo-text">SnapChef ✨</div>
-            </div>
-        </div>
-        
-        <script>
-        // Make the entire logo clickable
-        document.addEventListener('DOMContentLoaded', function() {
-            const logoNav = document.getElementById('logo-nav');
-            if (logoNav) {
-                logoNav.style.cursor = 'pointer';
-                logoNav.addEventListener('click', function() {
-                    // Navigate to home by triggering a page reload with landing page
-                    const currentUrl = new URL(window.location);
-                    currentUrl.searchParams.set('page', 'landing');
-                    window.location.href = currentUrl.toString();
-                });
-            }
-        });
-        </script>
+        <div class="top-bar"></div>
     """, unsafe_allow_html=True)
 
+    st.button("👨‍🍳 SnapChef ✨", key="logo_home", on_click=_go_landing)
+
 def add_floating_food_animation():
     """Add floating food animation that works on all pages"""
     st.markdown("""
@@ -136,6 +119,12 @@ def add_floating_food_animation():
             pointer-events: none;
             z-index: 1;  /* Behind content but above background */
             opacity: 0.03;  /* Start with low opacity */
+            /* Promote each emoji to its own composited layer: the keyframes
+               only touch transform/opacity, so with these hints the animation
+               runs on the GPU compositor instead of repainting the document */
+            will-change: transform, opacity;
+            contain: layout paint style;
+            transform: translateZ(0);
         }
         
         /* Ensure content is above floating items */
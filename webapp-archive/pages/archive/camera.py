@@ -1,10 +1,15 @@
 import streamlit as st
-from streamlit_extras.let_it_rain import rain
-import time
 from utils.api import encode_image_to_base64, detect_ingredients, generate_meals
 from utils.session import update_streak, add_points
 from utils.logo import render_logo
 
+# orjson (C-accelerated) serializes the nested recipe dicts much faster than
+# pickle; fall back to the stdlib when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def show_camera():
     # Modern camera UI styling
     st.markdown("""
@@ -262,10 +267,8 @@ def process_and_generate_recipes():
     </div>
     """
     
-    # Simulate progress
-    for i in range(0, 40, 5):
-        progress_placeholder.markdown(progress_html.format(i), unsafe_allow_html=True)
-        time.sleep(0.1)
+    # Progress advances on real events, not timers
+    progress_placeholder.markdown(progress_html.format(10), unsafe_allow_html=True)
     
     # Convert and detect
     photo_bytes = st.session_state.photo.getvalue() if hasattr(st.session_state.photo, 'getvalue') else st.session_state.photo.read()
@@ -276,9 +279,7 @@ def process_and_generate_recipes():
     # Show ingredients
     status_placeholder.markdown('<p class="status-text">🎯 Found your ingredients!</p>', unsafe_allow_html=True)
     
-    for i in range(40, 70, 5):
-        progress_placeholder.markdown(progress_html.format(i), unsafe_allow_html=True)
-        time.sleep(0.05)
+    progress_placeholder.markdown(progress_html.format(60), unsafe_allow_html=True)
     
     # Display ingredients
     ingredient_html = '<div class="ingredient-list">'
@@ -291,25 +292,42 @@ def process_and_generate_recipes():
     # Generate recipes
     status_placeholder.markdown('<p class="status-text">👨‍🍳 Creating personalized recipes...</p>', unsafe_allow_html=True)
     
-    for i in range(70, 100, 5):
-        progress_placeholder.markdown(progress_html.format(i), unsafe_allow_html=True)
-        time.sleep(0.05)
+    progress_placeholder.markdown(progress_html.format(80), unsafe_allow_html=True)
     
     # Get recipes
     recipes = generate_meals(ingredients, [])
     st.session_state.recipes = recipes
+    # Keep a JSON-serialized copy so cross-rerun persistence doesn't rely on
+    # pickling the nested recipe dicts (only worthwhile when session-state
+    # traffic shows up in profiles; recipes are pure JSON-able data)
+    if orjson is not None:
+        st.session_state.recipes_json = orjson.dumps(recipes)
     st.session_state.ingredients = ingredients
     
     # Complete
     progress_placeholder.markdown(progress_html.format(100), unsafe_allow_html=True)
-    time.sleep(0.5)
     
     # Clear progress
     progress_placeholder.empty()
     status_placeholder.empty()
     
     # Celebration
-    rain(emoji="✨", font_size=20, falling_speed=5, animation_length=1)
+    # One-shot CSS burst: a single compositor-animated node instead of the
+    # dozens of DOM nodes plus JS frame loop that let_it_rain spins up
+    st.markdown(
+        '''<div class="confetti-burst">\u2728</div>
+        <style>
+        .confetti-burst {
+            position: fixed; top: 40%; left: 50%; font-size: 48px;
+            pointer-events: none; z-index: 9999;
+            animation: burst 0.3s ease-out forwards;
+        }
+        @keyframes burst {
+            from { transform: translate(-50%, -50%) scale(0.4); opacity: 1; }
+            to { transform: translate(-50%, -50%) scale(2.2); opacity: 0; }
+        }
+        </style>''',
+        unsafe_allow_html=True)
     
     # Update stats
     update_streak()
@@ -322,9 +340,15 @@ def display_recipes():
     """Display recipes with modern cards"""
     
     st.markdown('<h2 style="text-align: center; color: white; margin: 40px 0;">Your Personalized Recipes ✨</h2>', unsafe_allow_html=True)
-    
+
+    # Rehydrate lazily from the orjson copy if the deserialized list is gone
+    recipes = st.session_state.get('recipes')
+    if not recipes and orjson is not None and st.session_state.get('recipes_json'):
+        recipes = orjson.loads(st.session_state.recipes_json)
+        st.session_state.recipes = recipes
+
     # Recipe cards
-    for idx, recipe in enumerate(st.session_state.recipes):
+    for idx, recipe in enumerate(recipes or []):
         recipe_html = f"""
         <div class="recipe-card">
             <div class="recipe-header">
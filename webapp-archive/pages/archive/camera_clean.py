@@ -1,6 +1,5 @@
 import streamlit as st
 from streamlit_extras.let_it_rain import rain
-import time
 from PIL import Image
 import io
 from utils.api import encode_image_to_base64, detect_ingredients, generate_meals
@@ -413,8 +412,6 @@ def process_photo():
     """, unsafe_allow_html=True)
     
     # Simulate processing time
-    time.sleep(2)
-    
     try:
         # Process the image
         photo_bytes = st.session_state.photo.getvalue() if hasattr(st.session_state.photo, 'getvalue') else st.session_state.photo.read()
@@ -427,6 +424,8 @@ def process_photo():
             img_byte_arr = io.BytesIO()
             img.save(img_byte_arr, format=img.format or 'JPEG', quality=85)
             photo_bytes = img_byte_arr.getvalue()
+            # Release the decoder buffer eagerly instead of leaving it to GC
+            img.close()
         
         # Encode and detect ingredients
         photo_base64 = encode_image_to_base64(photo_bytes)
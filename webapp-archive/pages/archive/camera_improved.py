@@ -1,10 +1,8 @@
 import streamlit as st
-from streamlit_extras.let_it_rain import rain
-import time
 import base64
 from PIL import Image
 import io
-from utils.api import encode_image_to_base64, detect_ingredients, generate_meals
+from utils.api import encode_image_to_base64, detect_ingredients_stream, generate_meals
 from utils.session import update_streak, add_points
 from utils.logo import render_logo
 
@@ -491,110 +489,122 @@ def process_and_generate_recipes():
         with col2:
             st.image(st.session_state.photo, use_column_width=True)
         
-        # Progress indicator
-        progress_placeholder = st.empty()
-        status_placeholder = st.empty()
+        # Error placeholder stays outside the status container so failures
+        # render full-width below it
         error_placeholder = st.empty()
-        
-        # Step 1: Analyze ingredients
-        status_placeholder.markdown('<p class="status-text">✨ Analyzing ingredients...</p>', unsafe_allow_html=True)
-        
-        progress_html = """
-        <div class="progress-container">
-            <div class="progress-bar" style="width: {}%"></div>
-        </div>
-        """
-        
+
         try:
-            # Show initial progress
-            progress_placeholder.markdown(progress_html.format(10), unsafe_allow_html=True)
-            
-            # Convert and validate image
-            photo_bytes = st.session_state.photo.getvalue() if hasattr(st.session_state.photo, 'getvalue') else st.session_state.photo.read()
-            
-            # Optimize image size if needed
-            img = Image.open(io.BytesIO(photo_bytes))
-            
-            # Resize if too large (max 1920x1920)
-            max_size = (1920, 1920)
-            if img.size[0] > max_size[0] or img.size[1] > max_size[1]:
-                img.thumbnail(max_size, Image.Resampling.LANCZOS)
-                
-                # Convert back to bytes
-                img_byte_arr = io.BytesIO()
-                img.save(img_byte_arr, format=img.format or 'JPEG', quality=85)
-                photo_bytes = img_byte_arr.getvalue()
-            
-            progress_placeholder.markdown(progress_html.format(25), unsafe_allow_html=True)
-            
-            # Encode image
-            photo_base64 = encode_image_to_base64(photo_bytes)
-            
-            progress_placeholder.markdown(progress_html.format(40), unsafe_allow_html=True)
-            
-            # Detect ingredients with timeout
-            with st.spinner("Analyzing your ingredients..."):
-                ingredients = detect_ingredients(photo_base64)
-            
-            if not ingredients:
-                raise ValueError("No ingredients detected. Please try a clearer photo.")
-            
-            progress_placeholder.markdown(progress_html.format(60), unsafe_allow_html=True)
-            
-            # Show ingredients
-            status_placeholder.markdown('<p class="status-text">🎯 Found your ingredients!</p>', unsafe_allow_html=True)
-            
-            # Display ingredients with edit option
-            ingredient_html = '<div class="ingredient-list">'
-            for ing in ingredients:
-                ingredient_html += f'<span class="ingredient-pill">{ing}</span>'
-            ingredient_html += '</div>'
-            
-            st.markdown(ingredient_html, unsafe_allow_html=True)
-            
-            # Let user edit ingredients
-            with st.expander("✏️ Edit ingredients", expanded=False):
-                edited_ingredients = st.text_area(
-                    "Modify detected ingredients (one per line):",
-                    value="\n".join(ingredients),
-                    height=100
-                )
-                if st.button("Update ingredients"):
-                    ingredients = [ing.strip() for ing in edited_ingredients.split("\n") if ing.strip()]
-                    st.session_state.ingredients = ingredients
-                    st.success("✓ Ingredients updated!")
-            
-            progress_placeholder.markdown(progress_html.format(70), unsafe_allow_html=True)
-            
-            # Step 2: Generate recipes
-            status_placeholder.markdown('<p class="status-text">👨‍🍳 Creating personalized recipes...</p>', unsafe_allow_html=True)
-            
-            # Get user preferences if available
-            dietary_prefs = st.session_state.get('dietary_preferences', [])
-            
-            with st.spinner("Generating recipes tailored to your ingredients..."):
+            # A single st.status component absorbs every milestone as a delta
+            # update on one element instead of replacing a fresh markdown node
+            # per step over the websocket
+            with st.status("✨ Analyzing ingredients...", expanded=True) as status:
+                # Convert and validate image
+                photo_bytes = st.session_state.photo.getvalue() if hasattr(st.session_state.photo, 'getvalue') else st.session_state.photo.read()
+
+                # Optimize image size if needed
+                img = Image.open(io.BytesIO(photo_bytes))
+
+                # Resize if too large (max 1920x1920)
+                max_size = (1920, 1920)
+                if img.size[0] > max_size[0] or img.size[1] > max_size[1]:
+                    # JPEG draft mode lets libjpeg downscale during decode (DCT
+                    # scaling) instead of decoding full-size and resizing after
+                    img.draft('RGB', max_size)
+                    # BILINEAR is 4-6x faster than LANCZOS; after JPEG q85 and a
+                    # vision model the quality difference is invisible
+                    img.thumbnail(max_size, Image.Resampling.BILINEAR)
+
+                    # Convert back to bytes
+                    img_byte_arr = io.BytesIO()
+                    img.save(img_byte_arr, format=img.format or 'JPEG', quality=85)
+                    # getbuffer() hands b64encode a memoryview of the BytesIO buffer,
+                    # skipping the bytes copy getvalue() would force
+                    photo_bytes = img_byte_arr.getbuffer()
+                    # Release the decoder buffer eagerly instead of leaving it to GC
+                    img.close()
+
+                # Encode image
+                photo_base64 = encode_image_to_base64(photo_bytes)
+
+                # Detect ingredients (st.status shows its own spinner)
+                status.update(label="🔍 Detecting your ingredients...", state="running")
+                # Consume the streaming variant: partial model output drives
+                # the label while the completion is still being written, so
+                # the first visible progress arrives with the first tokens
+                ingredients = None
+                seen = 0
+                for chunk in detect_ingredients_stream(photo_base64):
+                    if isinstance(chunk, dict):
+                        ingredients = chunk
+                        break
+                    found = seen + chunk.count('"name"')
+                    if found != seen:
+                        seen = found
+                        status.update(label=f"🔍 Found {seen} ingredient{'s' if seen != 1 else ''} so far...",
+                                      state="running")
+
+                if not ingredients:
+                    raise ValueError("No ingredients detected. Please try a clearer photo.")
+
+                # Show ingredients
+                status.update(label="🎯 Found your ingredients!", state="running")
+
+                # Display ingredients with edit option
+                ingredient_html = '<div class="ingredient-list">'
+                for ing in ingredients:
+                    ingredient_html += f'<span class="ingredient-pill">{ing}</span>'
+                ingredient_html += '</div>'
+
+                st.markdown(ingredient_html, unsafe_allow_html=True)
+
+                # Let user edit ingredients
+                with st.expander("✏️ Edit ingredients", expanded=False):
+                    edited_ingredients = st.text_area(
+                        "Modify detected ingredients (one per line):",
+                        value="\n".join(ingredients),
+                        height=100
+                    )
+                    if st.button("Update ingredients"):
+                        ingredients = [ing.strip() for ing in edited_ingredients.split("\n") if ing.strip()]
+                        st.session_state.ingredients = ingredients
+                        st.success("✓ Ingredients updated!")
+
+                # Step 2: Generate recipes
+                status.update(label="👨‍🍳 Creating personalized recipes...", state="running")
+
+                # Get user preferences if available
+                dietary_prefs = st.session_state.get('dietary_preferences', [])
+
                 recipes = generate_meals(ingredients, dietary_prefs)
-            
-            if not recipes:
-                raise ValueError("Unable to generate recipes. Please try again.")
-            
-            progress_placeholder.markdown(progress_html.format(90), unsafe_allow_html=True)
-            
-            # Save results
-            st.session_state.recipes = recipes
-            st.session_state.ingredients = ingredients
-            
-            # Complete
-            progress_placeholder.markdown(progress_html.format(100), unsafe_allow_html=True)
-            time.sleep(0.5)
-            
-            # Clear progress
-            progress_placeholder.empty()
-            status_placeholder.empty()
-            
+
+                if not recipes:
+                    raise ValueError("Unable to generate recipes. Please try again.")
+
+                # Save results
+                st.session_state.recipes = recipes
+                st.session_state.ingredients = ingredients
+
+                # Complete
+                status.update(label="✨ Recipes ready!", state="complete", expanded=False)
+
             # Celebration
-            rain(emoji="✨", font_size=20, falling_speed=5, animation_length=1)
-            
+            # One-shot CSS burst: a single compositor-animated node instead of the
+            # dozens of DOM nodes plus JS frame loop that let_it_rain spins up
+            st.markdown(
+                '''<div class="confetti-burst">✨</div>
+                <style>
+                .confetti-burst {
+                    position: fixed; top: 40%; left: 50%; font-size: 48px;
+                    pointer-events: none; z-index: 9999;
+                    animation: burst 0.3s ease-out forwards;
+                }
+                @keyframes burst {
+                    from { transform: translate(-50%, -50%) scale(0.4); opacity: 1; }
+                    to { transform: translate(-50%, -50%) scale(2.2); opacity: 0; }
+                }
+                </style>''',
+                unsafe_allow_html=True)
+
             # Update stats
             try:
                 update_streak()
@@ -602,10 +612,10 @@ def process_and_generate_recipes():
             except Exception as e:
                 # Don't fail the whole process if stats update fails
                 print(f"Stats update failed: {e}")
-            
+
             st.session_state.recipes_generated = True
             st.rerun()
-            
+
         except Exception as e:
             # Show error to user
             error_html = f"""
@@ -1,6 +1,5 @@
 import streamlit as st
 from streamlit_extras.let_it_rain import rain
-import time
 from PIL import Image
 import io
 from utils.api import encode_image_to_base64, detect_ingredients, generate_meals
@@ -400,8 +399,6 @@ def process_photo():
     """, unsafe_allow_html=True)
     
     # Simulate processing time
-    time.sleep(2)
-    
     try:
         # Process the image
         photo_bytes = st.session_state.photo.getvalue() if hasattr(st.session_state.photo, 'getvalue') else st.session_state.photo.read()
@@ -410,10 +407,19 @@ def process_photo():
         img = Image.open(io.BytesIO(photo_bytes))
         max_size = (1920, 1920)
         if img.size[0] > max_size[0] or img.size[1] > max_size[1]:
-            img.thumbnail(max_size, Image.Resampling.LANCZOS)
+            # JPEG draft mode lets libjpeg downscale during decode (DCT
+            # scaling) instead of decoding full-size and resizing after
+            img.draft('RGB', max_size)
+            # BILINEAR is 4-6x faster than LANCZOS; after JPEG q85 and a
+            # vision model the quality difference is invisible
+            img.thumbnail(max_size, Image.Resampling.BILINEAR)
             img_byte_arr = io.BytesIO()
             img.save(img_byte_arr, format=img.format or 'JPEG', quality=85)
-            photo_bytes = img_byte_arr.getvalue()
+            # getbuffer() hands b64encode a memoryview of the BytesIO buffer,
+            # skipping the bytes copy getvalue() would force
+            photo_bytes = img_byte_arr.getbuffer()
+            # Release the decoder buffer eagerly instead of leaving it to GC
+            img.close()
         
         # Encode and detect ingredients
         photo_base64 = encode_image_to_base64(photo_bytes)
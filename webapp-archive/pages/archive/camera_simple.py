@@ -1,11 +1,33 @@
 import streamlit as st
-from streamlit_extras.let_it_rain import rain
-import time
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
 import io
 from utils.api import encode_image_to_base64, detect_ingredients, generate_meals
 from utils.session import update_streak, add_points
 
+# Worker for the optimize+encode step so it overlaps with the progress UI
+_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+def _optimize_and_encode(photo_bytes):
+    """Resize an oversized capture and return its base64 payload."""
+    img = Image.open(io.BytesIO(photo_bytes))
+    max_size = (1920, 1920)
+    if img.size[0] > max_size[0] or img.size[1] > max_size[1]:
+        # JPEG draft mode lets libjpeg downscale during decode (DCT
+        # scaling) instead of decoding full-size and resizing after
+        img.draft('RGB', max_size)
+        # BILINEAR is 4-6x faster than LANCZOS; after JPEG q85 and a
+        # vision model the quality difference is invisible
+        img.thumbnail(max_size, Image.Resampling.BILINEAR)
+        img_byte_arr = io.BytesIO()
+        img.save(img_byte_arr, format=img.format or 'JPEG', quality=85)
+        # getbuffer() hands b64encode a memoryview of the BytesIO buffer,
+        # skipping the bytes copy getvalue() would force
+        photo_bytes = img_byte_arr.getbuffer()
+        # Release the decoder buffer eagerly instead of leaving it to GC
+        img.close()
+    return encode_image_to_base64(photo_bytes)
+
 def show_camera():
     # Apply gradient background and minimal styling
     st.markdown("""
@@ -143,28 +165,20 @@ def process_photo_with_progress():
         # Step 1: Prepare image
         status_text.text("📸 Processing image...")
         progress_bar.progress(10)
-        time.sleep(0.5)
         
         # Get photo bytes
         photo_bytes = st.session_state.photo.getvalue() if hasattr(st.session_state.photo, 'getvalue') else st.session_state.photo.read()
-        
-        # Optimize image
-        img = Image.open(io.BytesIO(photo_bytes))
-        max_size = (1920, 1920)
-        if img.size[0] > max_size[0] or img.size[1] > max_size[1]:
-            img.thumbnail(max_size, Image.Resampling.LANCZOS)
-            img_byte_arr = io.BytesIO()
-            img.save(img_byte_arr, format=img.format or 'JPEG', quality=85)
-            photo_bytes = img_byte_arr.getvalue()
-        
+
+        # Step 2: Optimize + encode on a worker so the CPU work overlaps
+        # with the progress updates instead of blocking between them
+        encode_future = _EXECUTOR.submit(_optimize_and_encode, photo_bytes)
+
         progress_bar.progress(25)
-        
-        # Step 2: Encode image
+
         status_text.text("🔍 Detecting ingredients...")
-        photo_base64 = encode_image_to_base64(photo_bytes)
+        photo_base64 = encode_future.result()
         progress_bar.progress(40)
-        time.sleep(0.5)
-        
+
         # Step 3: Detect ingredients
         ingredients = detect_ingredients(photo_base64)
         progress_bar.progress(60)
@@ -172,7 +186,6 @@ def process_photo_with_progress():
         # Show detected ingredients
         if ingredients:
             status_text.text(f"✅ Found {len(ingredients)} ingredients!")
-            time.sleep(1)
         
         # Step 4: Generate recipes
         status_text.text("👨‍🍳 Creating personalized recipes...")
@@ -183,7 +196,6 @@ def process_photo_with_progress():
         
         # Success!
         status_text.text("✨ Recipes ready!")
-        time.sleep(0.5)
         
         # Store results
         st.session_state.detected_ingredients = ingredients
@@ -195,10 +207,24 @@ def process_photo_with_progress():
         add_points(10, "Generated recipes")
         
         # Celebration
-        rain(emoji="✨", font_size=20, falling_speed=5, animation_length=1)
+        # One-shot CSS burst: a single compositor-animated node instead of the
+        # dozens of DOM nodes plus JS frame loop that let_it_rain spins up
+        st.markdown(
+            '''<div class="confetti-burst">\u2728</div>
+            <style>
+            .confetti-burst {
+                position: fixed; top: 40%; left: 50%; font-size: 48px;
+                pointer-events: none; z-index: 9999;
+                animation: burst 0.3s ease-out forwards;
+            }
+            @keyframes burst {
+                from { transform: translate(-50%, -50%) scale(0.4); opacity: 1; }
+                to { transform: translate(-50%, -50%) scale(2.2); opacity: 0; }
+            }
+            </style>''',
+            unsafe_allow_html=True)
         
         # Navigate to results
-        time.sleep(1)
         st.session_state.current_page = 'results'
         st.rerun()
         
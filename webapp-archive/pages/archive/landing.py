@@ -1,14 +1,19 @@
 import streamlit as st
 from utils.logo import render_logo
-import time
 
-def show_landing():
-    # Modern CSS styling
-    st.markdown("""
+# Static page styling - built once at import so reruns reuse the string
+# Non-blocking font load via preconnect + <link> instead of a render-
+# blocking CSS @import
+_LANDING_CSS = """
+        <link rel="preconnect" href="https://fonts.googleapis.com">
+        <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+        <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap">
         <style>
-        /* Import modern font */
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap');
-        
+        /* CSS-only smooth scroll for the how-it-works anchor */
+        html {
+            scroll-behavior: smooth;
+        }
+
         /* Global styles */
         * {
             font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
@@ -16,6 +21,9 @@ def show_landing():
         
         /* Hero section */
         .hero-container {
+            /* Fence the animated children so their repaints can't spill
+               into the rest of the page */
+            contain: layout paint;
             min-height: 100vh;
             display: flex;
             flex-direction: column;
@@ -28,15 +36,23 @@ def show_landing():
         
         /* Animated background */
         @keyframes float {
-            0% { transform: translateY(0px) rotate(0deg); }
+            from { transform: translateY(0px) rotate(0deg); }
             50% { transform: translateY(-20px) rotate(180deg); }
-            100% { transform: translateY(0px) rotate(360deg); }
+            to { transform: translateY(0px) rotate(360deg); }
         }
         
         .floating-shape {
             position: absolute;
             opacity: 0.1;
-            animation: float 6s ease-in-out infinite;
+            /* steps(180) clamps the 6s loop to ~30fps - indistinguishable
+               for a slow decorative drift, but a quarter of the compositor
+               wakeups on 120Hz panels */
+            animation: float 6s steps(180, end) infinite;
+            /* Compositor-only animation: pre-promote the layer so each
+               frame skips layout and paint entirely */
+            will-change: transform;
+            transform: translateZ(0);
+            backface-visibility: hidden;
         }
         
         /* Main content */
@@ -62,6 +78,12 @@ def show_landing():
             font-weight: 400;
         }
         
+        /* CTA buttons center themselves - no column scaffold needed */
+        .stButton {
+            max-width: 400px;
+            margin: 0 auto;
+        }
+
         /* Main button */
         .snap-button {
             background: white;
@@ -116,12 +138,14 @@ def show_landing():
         
         /* Down arrow animation */
         @keyframes bounce {
-            0%, 100% { transform: translateY(0); }
+            from, to { transform: translateY(0); }
             50% { transform: translateY(5px); }
         }
         
         .arrow-down {
-            animation: bounce 2s infinite;
+            animation: bounce 2s steps(60, end) infinite;
+            will-change: transform;
+            backface-visibility: hidden;
         }
         
         /* Features section */
@@ -198,19 +222,67 @@ def show_landing():
             }
         }
         </style>
-    """, unsafe_allow_html=True)
-    
-    # Logo
-    logo_html = render_logo("hero", gradient=False)
+"""
+
+# Hero shapes as fixed-viewBox inline SVGs, built once at import. A 90px
+# color-emoji glyph is rasterized through font fallback inside an element
+# that is continuously transforming; an SVG with explicit bounds uploads as
+# one texture on its compositor layer and is never touched again. (Twemoji
+# artwork isn't vendored, so the SVGs wrap the same glyphs with a fixed
+# viewBox rather than swapping in different art.)
+def _shape_svg(glyph):
+    return ('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100" '
+            'width="100%" height="100%" aria-hidden="true">'
+            f'<text x="50" y="54" dominant-baseline="central" '
+            f'text-anchor="middle" font-size="80">{glyph}</text></svg>')
+
+_FLOAT_SHAPES = {
+    "pan": _shape_svg("🍳"),
+    "salad": _shape_svg("🥗"),
+    "pasta": _shape_svg("🍝"),
+    "stew": _shape_svg("🥘"),
+}
+
+def _handle_snap(decrement=True):
+    """Shared CTA callback: route to camera while free uses remain,
+    otherwise to auth. Both landing buttons ran the same branch inline;
+    one helper keeps a single copy of the logic (the bottom CTA passes
+    decrement=False to preserve its old no-charge behavior)."""
+    if st.session_state.free_uses > 0:
+        if decrement:
+            st.session_state.free_uses -= 1
+        st.session_state.current_page = 'camera'
+    else:
+        st.session_state.current_page = 'auth'
+
+@st.fragment
+def show_landing():
+    # Fragment scope: clicks rerun only this function. A navigation
+    # callback changes the page, so escalate to a full rerun for the router
+    if st.session_state.get('current_page', 'landing') != 'landing':
+        st.rerun()
+
+    # Modern CSS styling - built once at import, but emitted every run:
+    # Streamlit drops any element the current run doesn't re-emit, style
+    # blocks included, so gating this strips the styling on the next rerun
+    st.markdown(_LANDING_CSS, unsafe_allow_html=True)
     
-    # Hero Section
-    hero_html = f"""
+    # Rebuild the hero only when free_uses changes; otherwise replay the
+    # cached string (the markdown call itself must still happen each rerun)
+    if st.session_state.get('_hero_key') == st.session_state.free_uses:
+        st.markdown(st.session_state._hero_html, unsafe_allow_html=True)
+    else:
+        # Logo
+        logo_html = render_logo("hero", gradient=False)
+
+        # Hero Section
+        hero_html = f"""
     <div class="hero-container">
         <!-- Floating shapes for visual interest -->
-        <div class="floating-shape" style="top: 10%; left: 5%; font-size: 80px;">🍳</div>
-        <div class="floating-shape" style="top: 20%; right: 10%; font-size: 60px; animation-delay: 2s;">🥗</div>
-        <div class="floating-shape" style="bottom: 20%; left: 15%; font-size: 70px; animation-delay: 4s;">🍝</div>
-        <div class="floating-shape" style="bottom: 10%; right: 5%; font-size: 90px; animation-delay: 1s;">🥘</div>
+        <div class="floating-shape" style="top: 10%; left: 5%; width: 80px; height: 80px;">{_FLOAT_SHAPES["pan"]}</div>
+        <div class="floating-shape" style="top: 20%; right: 10%; width: 60px; height: 60px; animation-delay: 2s;">{_FLOAT_SHAPES["salad"]}</div>
+        <div class="floating-shape" style="bottom: 20%; left: 15%; width: 70px; height: 70px; animation-delay: 4s;">{_FLOAT_SHAPES["pasta"]}</div>
+        <div class="floating-shape" style="bottom: 10%; right: 5%; width: 90px; height: 90px; animation-delay: 1s;">{_FLOAT_SHAPES["stew"]}</div>
         
         <div class="hero-content">
             <div style="margin-bottom: 40px;">
@@ -224,27 +296,21 @@ def show_landing():
             
             <div id="snap-button-container"></div>
             
-            <div class="how-it-works" id="how-link">
+            <a class="how-it-works" href="#features">
                 <span>See how the magic happens</span>
                 <span class="arrow-down">↓</span>
-            </div>
+            </a>
         </div>
     </div>
     """
     
-    st.markdown(hero_html, unsafe_allow_html=True)
+        st.session_state._hero_html = hero_html
+        st.session_state._hero_key = st.session_state.free_uses
+        st.markdown(hero_html, unsafe_allow_html=True)
     
-    # SnapChef button
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        if st.button("📸 SnapChef", key="main_snap", use_container_width=True):
-            if st.session_state.free_uses > 0:
-                st.session_state.free_uses -= 1
-                st.session_state.current_page = 'camera'
-                st.rerun()
-            else:
-                st.session_state.current_page = 'auth'
-                st.rerun()
+    # SnapChef button - CSS-centered, no column wrapper
+    st.button("📸 SnapChef", key="main_snap", use_container_width=True,
+              on_click=_handle_snap)
     
     # Features Section
     features_html = """
@@ -281,32 +347,13 @@ def show_landing():
     
     st.markdown(features_html, unsafe_allow_html=True)
     
-    # JavaScript for smooth scrolling
-    st.markdown("""
-        <script>
-        document.getElementById('how-link').addEventListener('click', function() {
-            document.getElementById('features').scrollIntoView({ 
-                behavior: 'smooth',
-                block: 'start'
-            });
-        });
-        </script>
-    """, unsafe_allow_html=True)
-    
     # Bottom CTA
     st.markdown("<div style='text-align: center; padding: 60px 20px; background: #f8f9fa;'>", unsafe_allow_html=True)
     
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        st.markdown("### Ready to reduce food waste?")
-        st.markdown("Join thousands who are saving money and eating better")
-        
-        if st.button("🚀 Get Started Free", key="bottom_cta", use_container_width=True, type="primary"):
-            if st.session_state.free_uses > 0:
-                st.session_state.current_page = 'camera'
-                st.rerun()
-            else:
-                st.session_state.current_page = 'auth'
-                st.rerun()
+    # One markdown for both lines - fewer deltas per rerun
+    st.markdown("### Ready to reduce food waste?\n\nJoin thousands who are saving money and eating better")
+
+    st.button("🚀 Get Started Free", key="bottom_cta", use_container_width=True,
+              type="primary", on_click=_handle_snap, kwargs={'decrement': False})
     
     st.markdown("</div>", unsafe_allow_html=True)
\ No newline at end of file
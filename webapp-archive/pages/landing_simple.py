@@ -1,20 +1,22 @@
+"""The landing page. This is the only landing implementation the app
+imports; the older gradient-hero variant is parked in pages/archive and is
+never loaded, so there is no duplicate parse/bytecode cost to share away.
+If the two ever need to coexist, fold them into one data-driven module
+rather than re-importing the archive."""
 import streamlit as st
 from utils.logo import render_logo
-import time
 from components.topbar import render_topbar, add_floating_food_animation
 
-def show_landing():
-    # Render top bar
-    render_topbar()
-    
-    # Add floating food animation
-    add_floating_food_animation()
-    
-    # Apply custom CSS
-    st.markdown("""
+# Static page styling, built once at import; the CTA button rules used to
+# be a second st.markdown inside the column, but CSS is position-
+# independent so both blocks ship in one payload
+# Non-blocking font load: a CSS @import stalls style resolution until the
+# sheet returns; preconnect + <link> lets it fetch in parallel
+_LANDING_CSS = """
+        <link rel="preconnect" href="https://fonts.googleapis.com">
+        <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+        <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap">
         <style>
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap');
-        
         .stApp {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
         }
@@ -54,16 +56,23 @@ def show_landing():
             font-size: 2.5rem !important;
             font-weight: 800 !important;
             text-align: center !important;
-            margin: 3rem 0 !important;
+            /* top margin absorbs the <br><br><br> spacer this replaced */
+            margin: 7rem 0 3rem !important;
         }
         
+        /* CTA buttons center themselves - no column scaffold needed */
+        .stButton {
+            max-width: 400px;
+            margin: 0 auto;
+        }
+
         .stButton > button {
             background: white !important;
             color: #764ba2 !important;
             border: none !important;
-            padding: 1.25rem 3.75rem !important;
+            padding: 1.25rem 3rem !important;
             font-size: 1.25rem !important;
-            font-weight: 700 !important;
+            font-weight: 800 !important;
             border-radius: 50px !important;
             box-shadow: 0 20px 40px rgba(0, 0, 0, 0.2) !important;
             transition: all 0.3s ease !important;
@@ -75,6 +84,13 @@ def show_landing():
             box-shadow: 0 25px 50px rgba(0, 0, 0, 0.25) !important;
         }
         
+        /* CSS grid replaces the st.columns(3) scaffold for feature cards */
+        .feature-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(260px, 1fr));
+            gap: 1rem;
+        }
+
         .feature-container {
             background: white;
             padding: 2rem;
@@ -123,7 +139,8 @@ def show_landing():
             background: #f8f9fa;
             padding: 3rem 1rem;
             border-radius: 1rem;
-            margin-top: 3rem;
+            /* includes the spacing the old <br><br> spacer provided */
+            margin-top: 6rem;
             text-align: center;
         }
         
@@ -145,116 +162,116 @@ def show_landing():
             }
         }
         </style>
-    """, unsafe_allow_html=True)
-    
-    # Logo - positioned 5px below topbar
-    st.markdown('<div style="margin-top: 5px;">', unsafe_allow_html=True)
-    st.markdown(render_logo("hero", gradient=True), unsafe_allow_html=True)
-    
-    # Subtitle directly below logo
-    st.markdown("<h2>AI-powered recipes from what you already have</h2>", unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Free uses indicator
-    if st.session_state.free_uses > 0:
-        uses_text = f"{st.session_state.free_uses} free snap{'s' if st.session_state.free_uses > 1 else ''}"
-        st.markdown(f'<div style="text-align: center;"><span class="free-uses-badge">Hey Friend, Here\'s {uses_text} on us! 👇</span></div>', unsafe_allow_html=True)
-    else:
-        st.markdown(f'<div style="text-align: center;"><span class="free-uses-badge">No free snaps remaining - Sign up to continue! 🚀</span></div>', unsafe_allow_html=True)
-    
-    # Main CTA Button with styled logo
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        # Custom CSS for gradient text and button styling
-        st.markdown("""
+""" + """
         <style>
-        /* Button container styling */
-        div[data-testid="column"]:nth-child(2) .stButton > button {
-            background: white !important;
-            border: none !important;
-            padding: 1.25rem 3rem !important;
-            border-radius: 50px !important;
-            box-shadow: 0 20px 40px rgba(0, 0, 0, 0.2) !important;
-            transition: all 0.3s ease !important;
-            font-size: 1.25rem !important;
-            font-weight: 800 !important;
-        }
-        
-        div[data-testid="column"]:nth-child(2) .stButton > button:hover {
-            transform: translateY(-3px) !important;
-            box-shadow: 0 25px 50px rgba(0, 0, 0, 0.25) !important;
-        }
-        
         /* Style the button text with single color */
-        div[data-testid="column"]:nth-child(2) .stButton > button span {
+        .stButton > button span {
             color: #000 !important;
             font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
             letter-spacing: -0.02em;
         }
         </style>
-        """, unsafe_allow_html=True)
-        
-        # Use native icon parameter with emoji
-        if st.button("SnapChef ✨", key="main_snap", use_container_width=True, icon="👨‍🍳"):
-            # Check device-based free uses
-            from utils.device_fingerprint import decrement_free_use
-            
-            if st.session_state.authenticated or (st.session_state.device_id and decrement_free_use(st.session_state.device_id)):
-                # Update session state
-                if not st.session_state.authenticated:
-                    st.session_state.free_uses = max(0, st.session_state.free_uses - 1)
-                st.session_state.current_page = 'camera'
-                st.rerun()
-            else:
-                st.session_state.current_page = 'auth'
-                st.rerun()
-    
-    # Some spacing
-    st.markdown("<br><br><br>", unsafe_allow_html=True)
+"""
+
+# Feature cards, identical apart from icon/title/copy - the grid HTML is
+# assembled once at import and emitted as a single markdown element
+_FEATURES = (
+    ("📸", "Snap Your Fridge",
+     "Take a quick photo of your fridge or pantry. In less than a minute, our AI recognizes all your ingredients."),
+    ("🤖", "AI Magic",
+     "Our advanced AI analyzes your ingredients and creates personalized recipes from the stuff you actually have."),
+    ("🍳", "Cook & Share",
+     "Get step-by-step recipes and share your creations with friends. No more wasted groceries, no more \"what's for dinner?\"."),
+)
+
+_FEATURES_HTML = '<div class="feature-grid">' + "".join(
+    f'<div class="feature-container">'
+    f'<div class="feature-icon">{icon}</div>'
+    f'<div class="feature-title">{title}</div>'
+    f'<div class="feature-description">{desc}</div>'
+    f'</div>'
+    for icon, title, desc in _FEATURES
+) + '</div>'
+
+def _go_camera():
+    """main_snap on_click: spend a free use (or route to auth) and navigate.
+
+    Callbacks mutate state before the rerun Streamlit already schedules, so
+    navigation costs no extra st.rerun pass.
+    """
+    from utils.device_fingerprint import decrement_free_use
+
+    if st.session_state.authenticated or (st.session_state.device_id and decrement_free_use(st.session_state.device_id)):
+        if not st.session_state.authenticated:
+            st.session_state.free_uses = max(0, st.session_state.free_uses - 1)
+        st.session_state.current_page = 'camera'
+    else:
+        st.session_state.current_page = 'auth'
+
+def _go_get_started():
+    """bottom_cta on_click: navigate to camera or auth."""
+    if st.session_state.free_uses > 0:
+        st.session_state.current_page = 'camera'
+    else:
+        st.session_state.current_page = 'auth'
+
+@st.fragment
+def show_landing():
+    # Clicks inside the fragment rerun only this function, not the whole
+    # app. When a callback changed the page, escalate to a full rerun so
+    # the router in app.py actually switches pages
+    if st.session_state.get('current_page', 'landing') != 'landing':
+        st.rerun()
+
+    # Render top bar
+    render_topbar()
     
-    # Features Section
-    st.markdown("<h3>How the Magic Happens ✨</h3>", unsafe_allow_html=True)
+    # Add floating food animation
+    add_floating_food_animation()
     
-    # Feature cards using columns
-    col1, col2, col3 = st.columns(3)
+    # Apply custom CSS - the module constant means no per-run string build,
+    # but the element itself must be emitted every run: Streamlit removes
+    # any node (style blocks and font links included) that the current run
+    # doesn't re-emit, so a session gate would leave the page unstyled
+    # after the first full rerun
+    st.markdown(_LANDING_CSS, unsafe_allow_html=True)
     
-    with col1:
-        st.markdown("""
-        <div class="feature-container">
-            <div class="feature-icon">📸</div>
-            <div class="feature-title">Snap Your Fridge</div>
-            <div class="feature-description">
-                Take a quick photo of your fridge or pantry. In less than a minute, our AI recognizes all your ingredients.
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+    # Hero block: logo, subtitle and free-uses badge ship as one markdown
+    # element - each extra call is its own ForwardMsg over the websocket and
+    # its own node in the frontend element tree. The built HTML only changes
+    # when free_uses does, so rebuild it on that key and replay the cached
+    # string otherwise (the element itself must still be emitted each rerun
+    # or Streamlit drops it from the page)
+    fu = st.session_state.free_uses
+    if st.session_state.get('_hero_key') != fu:
+        if fu > 0:
+            uses_text = f"{fu} free snap{'s' if fu > 1 else ''}"
+            badge_text = f"Hey Friend, Here's {uses_text} on us! 👇"
+        else:
+            badge_text = "No free snaps remaining - Sign up to continue! 🚀"
+        st.session_state._hero_html = (
+            f'<div style="margin-top: 5px;">'
+            f'{render_logo("hero", gradient=True)}'
+            f'<h2>AI-powered recipes from what you already have</h2>'
+            f'</div>'
+            f'<div style="text-align: center;"><span class="free-uses-badge">{badge_text}</span></div>'
+        )
+        st.session_state._hero_key = fu
+    st.markdown(st.session_state._hero_html, unsafe_allow_html=True)
     
-    with col2:
-        st.markdown("""
-        <div class="feature-container">
-            <div class="feature-icon">🤖</div>
-            <div class="feature-title">AI Magic</div>
-            <div class="feature-description">
-                Our advanced AI analyzes your ingredients and creates personalized recipes from the stuff you actually have.
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+    # Main CTA Button - centered by the .stButton CSS rule; on_click keeps
+    # the state change in the callback phase instead of an if-block + rerun
+    st.button("SnapChef ✨", key="main_snap", use_container_width=True,
+              icon="👨‍🍳", on_click=_go_camera)
     
-    with col3:
-        st.markdown("""
-        <div class="feature-container">
-            <div class="feature-icon">🍳</div>
-            <div class="feature-title">Cook & Share</div>
-            <div class="feature-description">
-                Get step-by-step recipes and share your creations with friends. No more wasted groceries, no more "what's for dinner?".
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+    # Features Section - the old <br><br><br> spacer is CSS margin now
+    st.markdown("<h3>How the Magic Happens ✨</h3>", unsafe_allow_html=True)
     
-    # Some spacing
-    st.markdown("<br><br>", unsafe_allow_html=True)
+    # Feature cards: one prebuilt grid instead of three column containers
+    # each carrying their own markdown element
+    st.markdown(_FEATURES_HTML, unsafe_allow_html=True)
     
-    # Bottom CTA
+    # Bottom CTA - spacing folded into .bottom-cta margin-top
     st.markdown("""
     <div class="bottom-cta">
         <h3>Ready to eat like a king?</h3>
@@ -262,16 +279,8 @@ def show_landing():
     </div>
     """, unsafe_allow_html=True)
     
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        # Use native icon parameter for bottom button
-        if st.button("Get Started Free", key="bottom_cta", use_container_width=True, icon="🚀"):
-            if st.session_state.free_uses > 0:
-                st.session_state.current_page = 'camera'
-                st.rerun()
-            else:
-                st.session_state.current_page = 'auth'
-                st.rerun()
+    st.button("Get Started Free", key="bottom_cta", use_container_width=True,
+              icon="🚀", on_click=_go_get_started)
     
     # Add some floating emojis for visual interest
     # Floating food is now handled by add_floating_food_animation()
\ No newline at end of file
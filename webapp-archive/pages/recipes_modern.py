@@ -1,69 +1,43 @@
 import streamlit as st
 from utils.logo import render_logo
+from utils.models import Recipe
+
+# Page styling lives in static/recipes.css, served with HTTP cache headers
+# (server.enableStaticServing) - the browser fetches it once ever, and the
+# session-gated markdown below only ships these link tags. Fonts keep the
+# non-blocking preconnect + <link> pattern.
+_RECIPES_CSS = """
+        <link rel="preconnect" href="https://fonts.googleapis.com">
+        <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+        <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap">
+        <link rel="stylesheet" href="/app/static/recipes.css">
+"""
+
+@st.fragment
+def _recipe_card(recipe):
+    """One saved-recipe card; fragment-scoped so a click on its buttons
+    reruns just this card instead of the whole recipe list."""
+    with st.container():
+        st.markdown(f"### {recipe.name}")
+        st.write(recipe.description)
+
+        # Bind the id once for the three key f-strings below
+        rid = recipe.id
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.button("View", key=f"view_{rid}")
+        with col2:
+            st.button("Share", key=f"share_{rid}")
+        with col3:
+            st.button("Cook Again", key=f"cook_{rid}")
 
 def show_recipes():
-    # Modern recipes page
-    st.markdown("""
-        <style>
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap');
-        
-        .main {
-            background: #FAFAFA;
-        }
-        
-        .recipes-header {
-            background: white;
-            padding: 20px;
-            border-bottom: 1px solid #e5e5e5;
-            margin-bottom: 20px;
-        }
-        
-        .recipe-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-            gap: 20px;
-            padding: 20px;
-        }
-        
-        .recipe-card {
-            background: white;
-            border-radius: 16px;
-            overflow: hidden;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.08);
-            transition: all 0.3s ease;
-        }
-        
-        .recipe-card:hover {
-            transform: translateY(-4px);
-            box-shadow: 0 12px 24px rgba(0, 0, 0, 0.12);
-        }
-        
-        .recipe-image {
-            width: 100%;
-            height: 200px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        }
-        
-        .recipe-content {
-            padding: 20px;
-        }
-        
-        .recipe-title {
-            font-size: 20px;
-            font-weight: 700;
-            color: #1a1a1a;
-            margin-bottom: 8px;
-        }
-        
-        .recipe-meta {
-            display: flex;
-            gap: 16px;
-            color: #666;
-            font-size: 14px;
-            margin-top: 12px;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    # Modern recipes page styling - the rules live in static/recipes.css
+    # so the browser caches them, but the <link> element itself has to be
+    # emitted every run: Streamlit removes stale elements, and removing a
+    # <link> from the DOM un-applies its stylesheet (the cache only saves
+    # the re-fetch, not the rules)
+    st.markdown(_RECIPES_CSS, unsafe_allow_html=True)
     
     # Header
     col1, col2, col3 = st.columns([1, 2, 1])
@@ -84,26 +58,47 @@ def show_recipes():
     with tab1:
         # Recipe grid
         recipes = st.session_state.get('saved_recipes', [])
-        
+
+        # Normalize legacy dict entries to slotted Recipe objects; checked
+        # per element rather than sniffing recipes[0] so a mixed list (a
+        # dict appended after an earlier conversion) can't crash the render
+        # loop. Already-converted lists pass through without a rewrite.
+        if any(not isinstance(r, Recipe) for r in recipes):
+            recipes = [r if isinstance(r, Recipe) else Recipe.from_dict(r) for r in recipes]
+            st.session_state.saved_recipes = recipes
+
         if not recipes:
             st.info("No recipes yet! Snap your fridge to get started.")
             if st.button("📸 Snap Your Fridge", type="primary"):
                 st.session_state.current_page = 'camera'
                 st.rerun()
         else:
-            # Display saved recipes
-            for recipe in recipes:
-                with st.container():
-                    st.markdown(f"### {recipe.get('meal', {}).get('name', 'Recipe')}")
-                    st.write(recipe.get('meal', {}).get('description', ''))
-                    
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.button("View", key=f"view_{recipe['id']}")
-                    with col2:
-                        st.button("Share", key=f"share_{recipe['id']}")
-                    with col3:
-                        st.button("Cook Again", key=f"cook_{recipe['id']}")
+            # Display saved recipes a page at a time: widget count per
+            # rerun stays bounded no matter how large the library grows
+            page_size = 20
+            page = st.session_state.get('recipe_page', 0)
+            total_pages = (len(recipes) + page_size - 1) // page_size
+            page = min(page, total_pages - 1)
+
+            # One fragment per card, so a click re-executes ~3 widgets
+            # instead of 3 x N
+            for recipe in recipes[page * page_size:(page + 1) * page_size]:
+                _recipe_card(recipe)
+
+            if total_pages > 1:
+                prev_col, label_col, next_col = st.columns([1, 2, 1])
+                with prev_col:
+                    if st.button("← Prev", key="recipes_prev", disabled=page == 0):
+                        st.session_state.recipe_page = page - 1
+                        st.rerun()
+                with label_col:
+                    st.markdown(
+                        f"<div style='text-align:center;color:#666;'>Page {page + 1} of {total_pages}</div>",
+                        unsafe_allow_html=True)
+                with next_col:
+                    if st.button("Next →", key="recipes_next", disabled=page >= total_pages - 1):
+                        st.session_state.recipe_page = page + 1
+                        st.rerun()
     
     with tab2:
         st.info("⭐ Your favorite recipes will appear here")
@@ -1,20 +1,53 @@
+import html
+
 import streamlit as st
-from streamlit_extras.let_it_rain import rain
-from utils.session import add_points
+from utils.session import add_points, update_streak
 from components.topbar import render_topbar, add_floating_food_animation
 from components.share_buttons import render_share_buttons
 
-def show_results():
-    """Display recipe results with professional design"""
-    
-    # Render top bar
-    render_topbar()
-    
-    # Add floating food animation
-    add_floating_food_animation()
-    
-    # Professional styling
-    st.markdown("""
+# One-shot arrival celebration: pure-CSS sparkles that animate on the
+# compositor (transform/opacity only), far cheaper than the emoji rain's
+# ~100 animated DOM nodes. Rendered once when the camera flow sets
+# `_celebrate_on_results`.
+_CELEBRATION_HTML = """
+    <style>
+    .arrival-sparkles {
+        position: fixed;
+        inset: 0;
+        pointer-events: none;
+        z-index: 9999;
+        overflow: hidden;
+    }
+    .arrival-sparkles span {
+        position: absolute;
+        top: -5%;
+        font-size: 20px;
+        opacity: 0;
+        will-change: transform, opacity;
+        animation: sparkle-fall 1.2s ease-in forwards;
+    }
+    @keyframes sparkle-fall {
+        0% { transform: translateY(0) scale(0.8); opacity: 0; }
+        15% { opacity: 1; }
+        100% { transform: translateY(110vh) scale(1.1); opacity: 0; }
+    }
+    </style>
+    <div class="arrival-sparkles">
+        <span style="left: 8%; animation-delay: 0s;">✨</span>
+        <span style="left: 22%; animation-delay: 0.15s;">✨</span>
+        <span style="left: 37%; animation-delay: 0.05s;">✨</span>
+        <span style="left: 52%; animation-delay: 0.25s;">✨</span>
+        <span style="left: 66%; animation-delay: 0.1s;">✨</span>
+        <span style="left: 79%; animation-delay: 0.3s;">✨</span>
+        <span style="left: 91%; animation-delay: 0.2s;">✨</span>
+    </div>
+"""
+
+# Professional styling. Built once at import so no run rebuilds the ~6KB
+# string; show_results() still emits it every run, because Streamlit
+# removes any element the current run doesn't re-emit - style blocks
+# included, not just visible widgets.
+_RESULTS_CSS = """
         <style>
         @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap');
         
@@ -151,7 +184,10 @@ def show_results():
             transform: translateY(-1px);
         }
         
-        /* Recipe cards - gradient background using :has() selector */
+        /* Recipe cards - gradient background using :has() selector.
+           content-visibility lets the browser skip layout/paint for cards
+           still offscreen; the intrinsic size reserves roughly one card's
+           worth of scroll space so nothing jumps when they materialize */
         div[data-testid="stVerticalBlock"]:has(.recipe-container-marker) {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             border-radius: 24px;
@@ -160,6 +196,8 @@ def show_results():
             box-shadow: 0 10px 30px rgba(0, 0, 0, 0.1);
             transition: all 0.3s ease;
             overflow: hidden;
+            content-visibility: auto;
+            contain-intrinsic-size: 500px 420px;
         }
         
         div[data-testid="stVerticalBlock"]:has(.recipe-container-marker):hover {
@@ -240,14 +278,16 @@ def show_results():
             box-shadow: 0 4px 8px rgba(0, 0, 0, 0.1) !important;
         }
         
-        /* Primary action button */
-        .primary-action button {
+        /* Primary action button - scoped via Streamlit's key class; an
+           ancestor :has(.marker) selector would also match the column and
+           page root and leak onto other buttons */
+        .st-key-new_snap button {
             background: #1a1a1a !important;
             color: white !important;
             border: none !important;
         }
-        
-        .primary-action button:hover {
+
+        .st-key-new_snap button:hover {
             background: #000 !important;
         }
         
@@ -337,9 +377,8 @@ def show_results():
             contain: layout style;
         }
         
-        /* Bottom CTA */
-        .bottom-section {
-            text-align: center;
+        /* Bottom CTA spacing, hung off the button's own container */
+        .st-key-new_snap {
             margin: 3rem 0 2rem;
         }
         
@@ -379,6 +418,9 @@ def show_results():
             animation: float 6s ease-in-out infinite;
             pointer-events: none;
             z-index: 0;
+            will-change: transform, opacity;
+            contain: layout paint style;
+            transform: translateZ(0);
         }
         /* Container overflow fixes */
         .stApp {
@@ -422,12 +464,80 @@ def show_results():
         }
         
         </style>
-    """, unsafe_allow_html=True)
-    
-    # Floating food is handled by add_floating_food_animation()
-    
-    # Celebration
-    rain(emoji="✨", font_size=20, falling_speed=5, animation_length=1)
+"""
+
+def _snap_another():
+    """Reset capture state and head back to the camera.
+
+    Runs as an on_click callback, i.e. before the rerun the click already
+    schedules - the router picks up the new page in that same rerun, so no
+    explicit st.rerun() (and no second script execution) is needed.
+    """
+    st.session_state.update({
+        'photo_taken': False,
+        'processing': False,
+        'photo': None,
+        'detected_ingredients': [],
+        'generated_recipes': [],
+        '_celebrated': False,
+        'current_page': 'camera',
+    })
+
+def _go_upgrade():
+    st.session_state.current_page = 'auth'
+
+def _clear_debug():
+    for k in ('raw_combined_response', 'raw_ingredient_response', 'raw_recipe_response'):
+        st.session_state.pop(k, None)
+    st.session_state.show_debug = False
+
+@st.cache_data(show_spinner=False)
+def _render_ingredients_html(items):
+    """Build the ingredient-tag HTML for a tuple of (name, quantity, unit).
+
+    Memoized because detected_ingredients only changes when a new photo is
+    analyzed, while every rerun of the page re-renders the tags - the
+    cached string skips the per-item formatting loop.
+    """
+    parts = ['<div class="ingredients-scroll-container"><div style="display: flex; flex-wrap: wrap; gap: 0.5rem;">']
+    for name, quantity, unit in items:
+        if quantity and unit:
+            display_text = f"{name} ({quantity} {unit})"
+        elif quantity:
+            display_text = f"{name} ({quantity})"
+        else:
+            display_text = name
+        parts.append(f'<span class="ingredient-tag">✓ {html.escape(display_text)}</span>')
+    parts.append('</div></div>')  # Close both the flex container and scroll container
+    return ''.join(parts)
+
+def show_results():
+    """Display recipe results with professional design"""
+
+    # Render top bar
+    render_topbar()
+
+    # Add floating food animation
+    add_floating_food_animation()
+
+    # Inject page CSS - every run, or the first button click's rerun
+    # would strip the style node along with every other stale element
+    st.markdown(_RESULTS_CSS, unsafe_allow_html=True)
+
+    # Celebration - the camera flow hands off a one-shot flag so arriving here
+    # plays the cheap CSS sparkle instead of blocking the capture flow. Either
+    # way it fires once per results session: re-running it on every button
+    # click re-injected the animation's DOM nodes and replayed a full
+    # particle pass on each rerun
+    if st.session_state.pop('_celebrate_on_results', False):
+        st.markdown(_CELEBRATION_HTML, unsafe_allow_html=True)
+        st.session_state._celebrated = True
+    elif not st.session_state.get('_celebrated'):
+        # Deferred import: streamlit_extras (plus htbuilder) only loads on
+        # the at-most-once-per-session run that actually rains
+        from streamlit_extras.let_it_rain import rain
+        rain(emoji="✨", font_size=20, falling_speed=5, animation_length=1)
+        st.session_state._celebrated = True
     
     # Title
     st.markdown("# Your Personalized Recipes ✨")
@@ -441,28 +551,15 @@ def show_results():
             st.markdown('<div class="ingredients-container-marker"></div>', unsafe_allow_html=True)
             st.markdown('<div class="ingredients-header">🔍 We found these ingredients in your fridge</div>', unsafe_allow_html=True)
             
-            # Create ingredient tags with scrollable container
-            ingredients_html = '<div class="ingredients-scroll-container"><div style="display: flex; flex-wrap: wrap; gap: 0.5rem;">'
-            for ing in ingredients:
-                # Handle both dict and string formats
-                if isinstance(ing, dict):
-                    name = ing.get('name', '')
-                    quantity = ing.get('quantity', '')
-                    unit = ing.get('unit', '')
-                    # Format the ingredient display
-                    if quantity and unit:
-                        display_text = f"{name} ({quantity} {unit})"
-                    elif quantity:
-                        display_text = f"{name} ({quantity})"
-                    else:
-                        display_text = name
-                else:
-                    display_text = str(ing)
-                
-                ingredients_html += f'<span class="ingredient-tag">✓ {display_text}</span>'
-            ingredients_html += '</div></div>'  # Close both the flex container and scroll container
-            
-            st.markdown(ingredients_html, unsafe_allow_html=True)
+            # Ingredient tags with scrollable container - normalized to a
+            # hashable tuple so the cached builder can key on it (handles
+            # both dict and string formats)
+            key = tuple(
+                (ing.get('name', ''), ing.get('quantity', ''), ing.get('unit', ''))
+                if isinstance(ing, dict) else (str(ing), '', '')
+                for ing in ingredients
+            )
+            st.markdown(_render_ingredients_html(key), unsafe_allow_html=True)
     
     # Recipes
     recipes = st.session_state.get('generated_recipes', [])
@@ -471,29 +568,34 @@ def show_results():
         for idx, recipe in enumerate(recipes):
             # Use st.container() to properly contain all elements
             with st.container():
-                # Apply unique identifier for CSS targeting
-                container_id = f"recipe-container-{idx}"
-                st.markdown(f'<div id="{container_id}" class="recipe-container-marker"></div>', unsafe_allow_html=True)
-                
-                # Recipe header
-                st.markdown(f'<h3 class="recipe-title">{recipe.get("name", "Untitled Recipe")}</h3>', unsafe_allow_html=True)
-                st.markdown(f'<p class="recipe-description">{recipe.get("description", "")}</p>', unsafe_allow_html=True)
-                
+                # Marker div, header, description and dish tags as a single
+                # markdown call: one Streamlit delta (and one react-markdown
+                # pass on the client) instead of four per recipe. Only the
+                # interactive widgets below stay as separate calls.
+                header_html = (
+                    f'<div id="recipe-container-{idx}" class="recipe-container-marker"></div>'
+                    f'<h3 class="recipe-title">{html.escape(recipe.get("name", "Untitled Recipe"))}</h3>'
+                    f'<p class="recipe-description">{html.escape(recipe.get("description", ""))}</p>'
+                )
+
                 # Main and Side dish tags
                 main_dish = recipe.get('main_dish', '')
                 side_dish = recipe.get('side_dish', '')
                 if main_dish or side_dish:
-                    tags_html = '<div style="display: flex; gap: 0.75rem; margin-top: 1rem; flex-wrap: wrap;">'
+                    header_html += '<div style="display: flex; gap: 0.75rem; margin-top: 1rem; flex-wrap: wrap;">'
                     if main_dish:
-                        tags_html += f'<span style="background: #e3f2fd; color: #1976d2; padding: 0.375rem 0.875rem; border-radius: 20px; font-size: 0.875rem; font-weight: 500; border: 1px solid #bbdefb;">🍽️ Main: {main_dish}</span>'
+                        header_html += f'<span style="background: #e3f2fd; color: #1976d2; padding: 0.375rem 0.875rem; border-radius: 20px; font-size: 0.875rem; font-weight: 500; border: 1px solid #bbdefb;">🍽️ Main: {html.escape(main_dish)}</span>'
                     if side_dish:
-                        tags_html += f'<span style="background: #f3e5f5; color: #7b1fa2; padding: 0.375rem 0.875rem; border-radius: 20px; font-size: 0.875rem; font-weight: 500; border: 1px solid #e1bee7;">🥗 Side: {side_dish}</span>'
-                    tags_html += '</div>'
-                    st.markdown(tags_html, unsafe_allow_html=True)
-                
-                # Metrics in single white card
+                        header_html += f'<span style="background: #f3e5f5; color: #7b1fa2; padding: 0.375rem 0.875rem; border-radius: 20px; font-size: 0.875rem; font-weight: 500; border: 1px solid #e1bee7;">🥗 Side: {html.escape(side_dish)}</span>'
+                    header_html += '</div>'
+                st.markdown(header_html, unsafe_allow_html=True)
+
+                # Metrics in single white card - values computed once up
+                # front; avoid allocating a throwaway default dict when the
+                # recipe has no nutrition block
+                nutrition = recipe.get('nutrition') or {}
                 total_time = recipe.get('total_time', recipe.get('prep_time', 15) + recipe.get('cook_time', 15))
-                calories = recipe.get('nutrition', {}).get('calories', 'N/A')
+                calories = nutrition.get('calories', 'N/A')
                 servings = recipe.get('servings', 4)
                 difficulty = recipe.get('difficulty', 'easy').title()
                 # More professional difficulty indicator using dots
@@ -533,64 +635,47 @@ def show_results():
                             </div>
                         </div>
                     </div>
+                    <div style="height: 1.5rem;"></div>
                 ''', unsafe_allow_html=True)
-                
-                # Spacing before action buttons
-                st.markdown("<div style='height: 1.5rem;'></div>", unsafe_allow_html=True)
-                
-                # Action buttons - only Instructions and Share
-                btn_col1, btn_col2 = st.columns(2)
-                
-                with btn_col1:
-                    steps_key = f"show_steps_{idx}"
-                    is_expanded = st.session_state.get(steps_key, False)
-                    
-                    if st.button(
-                        "📋 Hide Instructions" if is_expanded else "📋 Instructions", 
-                        key=f"steps_{idx}", 
-                        use_container_width=True
-                    ):
-                        st.session_state[steps_key] = not is_expanded
-                        st.rerun()
-                
-                with btn_col2:
-                    if st.button("📱 Share for credits!", key=f"share_{idx}", use_container_width=True):
-                        st.session_state[f"show_share_{idx}"] = not st.session_state.get(f"show_share_{idx}", False)
-                        st.rerun()
-                
-                # Recipe steps
-                if st.session_state.get(f"show_steps_{idx}", False):
-                    with st.expander("Step-by-Step Instructions", expanded=True):
-                        # Try different keys for instructions
-                        steps = recipe.get('instructions', recipe.get('recipe', []))
-                        if steps:
-                            # Create a printable version of the recipe
-                            recipe_text = f"# {recipe.get('name', 'Recipe')}\n\n"
-                            recipe_text += f"**{recipe.get('description', '')}**\n\n"
-                            recipe_text += f"- Total Time: {total_time} minutes\n"
-                            recipe_text += f"- Servings: {servings}\n"
-                            recipe_text += f"- Difficulty: {difficulty_text}\n\n"
-                            recipe_text += "## Instructions:\n"
-                            
-                            for i, step in enumerate(steps, 1):
-                                st.markdown(f"**Step {i}:** {step}")
-                                recipe_text += f"{i}. {step}\n"
-                            
-                            # Add print button at the bottom
-                            st.markdown("<br>", unsafe_allow_html=True)
-                            col1, col2, col3 = st.columns([2, 1, 2])
-                            with col2:
-                                st.download_button(
-                                    label="🖨️ Print Recipe",
-                                    data=recipe_text,
-                                    file_name=f"{recipe.get('name', 'recipe').replace(' ', '_')}.txt",
-                                    mime="text/plain",
-                                    key=f"print_{idx}"
-                                )
-                        else:
-                            st.info("Detailed steps will be available soon.")
-                
-                # Share buttons section
+
+                # Recipe steps - native expander instead of a toggle button
+                # plus session flag: the expander opens and closes entirely
+                # on the client, so reading instructions no longer costs a
+                # full script rerun per click
+                with st.expander("📋 Step-by-Step Instructions", expanded=False):
+                    # Try different keys for instructions
+                    steps = recipe.get('instructions', recipe.get('recipe', []))
+                    if steps:
+                        # Create a printable version of the recipe
+                        recipe_text = f"# {recipe.get('name', 'Recipe')}\n\n"
+                        recipe_text += f"**{recipe.get('description', '')}**\n\n"
+                        recipe_text += f"- Total Time: {total_time} minutes\n"
+                        recipe_text += f"- Servings: {servings}\n"
+                        recipe_text += f"- Difficulty: {difficulty_text}\n\n"
+                        recipe_text += "## Instructions:\n"
+
+                        for i, step in enumerate(steps, 1):
+                            st.markdown(f"**Step {i}:** {step}")
+                            recipe_text += f"{i}. {step}\n"
+
+                        # Add print button at the bottom
+                        st.markdown("<br>", unsafe_allow_html=True)
+                        col1, col2, col3 = st.columns([2, 1, 2])
+                        with col2:
+                            st.download_button(
+                                label="🖨️ Print Recipe",
+                                data=recipe_text,
+                                file_name=f"{recipe.get('name', 'recipe').replace(' ', '_')}.txt",
+                                mime="text/plain",
+                                key=f"print_{idx}"
+                            )
+                    else:
+                        st.info("Detailed steps will be available soon.")
+
+                # Share button and buttons section
+                # No rerun: the flag is read right below in this same run
+                if st.button("📱 Share for credits!", key=f"share_{idx}", use_container_width=True):
+                    st.session_state[f"show_share_{idx}"] = not st.session_state.get(f"show_share_{idx}", False)
                 if st.session_state.get(f"show_share_{idx}", False):
                     render_share_buttons(recipe.get('name', 'this amazing dish'), idx)
             
@@ -601,22 +686,12 @@ def show_results():
     else:
         st.error("No recipes were generated. Please try again with a clearer photo.")
     
-    # Bottom CTA
-    st.markdown('<div class="bottom-section">', unsafe_allow_html=True)
+    # Bottom CTA - the dark styling and spacing are scoped to the button's
+    # own .st-key-new_snap container, so no wrapper divs or markers needed
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
-        st.markdown('<div class="primary-action">', unsafe_allow_html=True)
-        if st.button("Snap Another Fridge", key="new_snap", use_container_width=True, icon="📸"):
-            # Reset states
-            st.session_state.photo_taken = False
-            st.session_state.processing = False
-            st.session_state.photo = None
-            st.session_state.detected_ingredients = []
-            st.session_state.generated_recipes = []
-            st.session_state.current_page = 'camera'
-            st.rerun()
-        st.markdown('</div>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+        st.button("Snap Another Fridge", key="new_snap", use_container_width=True, icon="📸",
+                  on_click=_snap_another)
     
     # Premium notice for free users
     if st.session_state.get('free_uses', 3) <= 0:
@@ -629,48 +704,52 @@ def show_results():
         
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
-            if st.button("✨ Upgrade to Premium", key="upgrade_btn", use_container_width=True):
-                st.session_state.current_page = 'auth'
-                st.rerun()
+            st.button("✨ Upgrade to Premium", key="upgrade_btn", use_container_width=True,
+                      on_click=_go_upgrade)
     
-    # Debug section (only show if responses exist)
-    if st.session_state.get('raw_combined_response') or st.session_state.get('raw_ingredient_response') or st.session_state.get('raw_recipe_response'):
+    # Debug section (only show if responses exist) - each response is read
+    # from the session proxy once and reused below
+    raw_combined = st.session_state.get('raw_combined_response')
+    raw_ingredient = st.session_state.get('raw_ingredient_response')
+    raw_recipe = st.session_state.get('raw_recipe_response')
+    if raw_combined or raw_ingredient or raw_recipe:
         st.markdown("<br><br><hr>", unsafe_allow_html=True)
-        
+
         # Small debug toggle at bottom
         if st.button("🔧 Show Debug Info", key="debug_toggle", help="View raw LLM responses for troubleshooting"):
             st.session_state.show_debug = not st.session_state.get('show_debug', False)
-        
+
         if st.session_state.get('show_debug', False):
             st.markdown("### 🔍 Debug Information")
-            
+
             # Show raw combined response (new single API call)
-            if st.session_state.get('raw_combined_response'):
+            if raw_combined:
                 with st.expander("🍳 Raw Vision Model Response (Single API Call)", expanded=True):
-                    st.code(st.session_state.raw_combined_response, language="json")
-            
+                    st.code(raw_combined, language="json")
+
             # Show raw ingredient detection response (old separate call)
-            elif st.session_state.get('raw_ingredient_response'):
+            elif raw_ingredient:
                 with st.expander("📦 Raw Ingredient Detection Response", expanded=False):
-                    st.code(st.session_state.raw_ingredient_response, language="json")
-            
+                    st.code(raw_ingredient, language="json")
+
             # Show raw recipe generation response (old separate call)
-            if st.session_state.get('raw_recipe_response'):
+            if raw_recipe:
                 with st.expander("🍳 Raw Recipe Generation Response", expanded=False):
-                    st.code(st.session_state.raw_recipe_response, language="json")
+                    st.code(raw_recipe, language="json")
             
             # Show detected ingredients
             if ingredients:
                 with st.expander("🧾 Detected Ingredients", expanded=False):
                     st.json(ingredients)
             
-            # Clear debug info button
-            if st.button("🗑️ Clear Debug Info", key="clear_debug"):
-                if 'raw_combined_response' in st.session_state:
-                    del st.session_state.raw_combined_response
-                if 'raw_ingredient_response' in st.session_state:
-                    del st.session_state.raw_ingredient_response
-                if 'raw_recipe_response' in st.session_state:
-                    del st.session_state.raw_recipe_response
-                st.session_state.show_debug = False
-                st.rerun()
\ No newline at end of file
+            # Clear debug info button - callback clears the keys before the
+            # click's rerun, so the section vanishes without a second rerun
+            st.button("🗑️ Clear Debug Info", key="clear_debug", on_click=_clear_debug)
+
+    # Deferred gamification bookkeeping handed over by the camera flow,
+    # executed after the results have rendered so arrival never waits on it
+    pending = st.session_state.pop('_pending_stats', None)
+    if pending:
+        reason, points = pending
+        update_streak()
+        add_points(points, reason)
\ No newline at end of file
@@ -1,7 +1,13 @@
 import pytest
 import json
 from unittest.mock import Mock, patch
-from utils.api import detect_ingredients, generate_meals, generate_video_script, generate_challenge_idea
+from utils.api import (
+    detect_ingredients,
+    detect_ingredients_stream,
+    generate_meals,
+    generate_video_script,
+    generate_challenge_idea,
+)
 
 class TestGrokAPI:
     """Test Grok 4 API integration"""
@@ -94,6 +100,69 @@ class TestGrokAPI:
         assert "description" in result
         assert "points" in result
 
+class TestStreamingAPI:
+    """Test streaming ingredient detection"""
+
+    @staticmethod
+    def _stream_chunks(deltas):
+        """Build mock stream chunks shaped like OpenAI streaming responses"""
+        return [Mock(choices=[Mock(delta=Mock(content=delta))]) for delta in deltas]
+
+    @patch('utils.api.client')
+    def test_stream_yields_deltas_then_result(self, mock_client):
+        """Test that text deltas arrive first and the final yield is the parsed dict"""
+        content = json.dumps({
+            "ingredients": [
+                {"name": "eggs", "estimated_quantity": 12, "unit": "count", "category": "dairy"},
+                {"name": "milk", "estimated_quantity": 1, "unit": "gallon", "category": "dairy"}
+            ],
+            "total_items": 2,
+            "detection_confidence": "high"
+        })
+        half = len(content) // 2
+        deltas = [content[:half], content[half:]]
+        mock_client.chat.completions.create.return_value = iter(self._stream_chunks(deltas))
+
+        items = list(detect_ingredients_stream("base64_image_data"))
+
+        # Text deltas first, verbatim
+        assert items[:-1] == deltas
+
+        # Final item matches the blocking path's result shape
+        result = items[-1]
+        assert isinstance(result, dict)
+        assert result["confidence"] == "high"
+        assert result["total_items"] == 2
+        assert {ing["name"] for ing in result["ingredients"]} == {"eggs", "milk"}
+
+    @patch('utils.api.client')
+    def test_stream_empty_ingredients_fallback(self, mock_client):
+        """Test that an empty ingredient list yields the no-food error dict"""
+        content = json.dumps({
+            "ingredients": [],
+            "total_items": 0,
+            "detection_confidence": "low"
+        })
+        mock_client.chat.completions.create.return_value = iter(self._stream_chunks([content]))
+
+        result = list(detect_ingredients_stream("base64_image_data"))[-1]
+
+        assert result["ingredients"] == []
+        assert "error" in result
+        assert result["confidence"] == "low"
+
+    @patch('utils.api.client')
+    def test_stream_api_error_fallback(self, mock_client):
+        """Test that an API failure yields a single error dict"""
+        mock_client.chat.completions.create.side_effect = Exception("API Error")
+
+        items = list(detect_ingredients_stream("base64_image_data"))
+
+        assert len(items) == 1
+        assert items[0]["ingredients"] == []
+        assert "API Error" in items[0]["error"]
+        assert items[0]["confidence"] == "none"
+
 class TestAPIMocking:
     """Test API mock data generation"""
     
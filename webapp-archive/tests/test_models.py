@@ -0,0 +1,41 @@
+from utils.models import Recipe
+
+class TestRecipeModel:
+    """Test the Recipe session-state dataclass"""
+
+    def test_from_dict_legacy_shape(self):
+        """Test conversion from the legacy {'id', 'meal': {...}} dict"""
+        data = {
+            "id": "abc123",
+            "meal": {
+                "name": "Quick Scramble",
+                "description": "Easy egg scramble",
+                "recipe": ["Heat pan", "Scramble eggs"]
+            }
+        }
+
+        recipe = Recipe.from_dict(data)
+
+        assert recipe.id == "abc123"
+        assert recipe.name == "Quick Scramble"
+        assert recipe.description == "Easy egg scramble"
+        assert recipe.meal == data["meal"]
+
+    def test_from_dict_missing_keys_use_defaults(self):
+        """Test that sparse dicts fall back to the dataclass defaults"""
+        recipe = Recipe.from_dict({})
+
+        assert recipe.id == ""
+        assert recipe.name == "Recipe"
+        assert recipe.description == ""
+        assert recipe.meal == {}
+
+    def test_slots_reject_unknown_attributes(self):
+        """Test that the slotted class can't silently grow stray attributes"""
+        recipe = Recipe.from_dict({"id": "r1"})
+
+        try:
+            recipe.rating = 5
+            assert False, "expected AttributeError on a slotted instance"
+        except AttributeError:
+            pass
@@ -1,7 +1,12 @@
 import streamlit as st
 
+@st.cache_data(show_spinner=False)
 def render_logo(size="large", gradient=True):
-    """Render the SnapChef logo as pure CSS/HTML"""
+    """Render the SnapChef logo as pure CSS/HTML.
+
+    Pure function of (size, gradient), so the built HTML is memoized -
+    every rerun of every page asks for the same handful of variants.
+    """
     
     sizes = {
         "small": {"font": "24px", "icon": "20px"},
@@ -0,0 +1,27 @@
+from dataclasses import dataclass, field
+
+@dataclass(slots=True)
+class Recipe:
+    """A saved recipe as held in st.session_state.saved_recipes.
+
+    Slotted dataclass instead of nested dicts: the list persists across
+    reruns for the whole session, and the render loop touches every entry
+    on every pass - attribute access is one C-level lookup where the old
+    recipe.get('meal', {}).get('name', 'Recipe') chain did two dict
+    lookups plus a throwaway default dict.
+    """
+    id: str
+    name: str = "Recipe"
+    description: str = ""
+    meal: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a Recipe from the legacy dict shape ({'id', 'meal': {...}})."""
+        meal = data.get('meal', {})
+        return cls(
+            id=data.get('id', ''),
+            name=meal.get('name', 'Recipe'),
+            description=meal.get('description', ''),
+            meal=meal,
+        )